@@ -1,14 +1,85 @@
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
-import math
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import os
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+
+try:
+  import polars as pl
+except ImportError:
+  pl = None
+
+try:
+  import pyarrow
+except ImportError:
+  pyarrow = None
+
+_sv = None
+_AutoViz_Class = None
+
+def _to_arrow_strings(dataset: pd.DataFrame) -> pd.DataFrame:
+  """
+  Convierte las columnas de tipo object que solo contienen texto a cadenas respaldadas por
+  PyArrow, de modo que value_counts y nunique usen los kernels de Arrow en lugar de objetos
+  de Python. Las columnas con valores de otros tipos se dejan intactas para no alterarlos.
+  Si PyArrow no está instalado, devuelve el conjunto de datos sin cambios.
+  """
+  if pyarrow is None:
+    return dataset
+  string_columns = [
+    col for col in dataset.select_dtypes(include='object').columns
+    if pd.api.types.infer_dtype(dataset[col], skipna=True) == 'string'
+  ]
+  if not string_columns:
+    return dataset
+  return dataset.astype({col: 'string[pyarrow]' for col in string_columns})
+
+def _arrow_string_types(arrow_type):
+  """
+  types_mapper para Table.to_pandas que lleva las columnas de texto de Arrow directamente
+  a cadenas respaldadas por PyArrow, sin pasar por objetos de Python.
+  """
+  if pyarrow.types.is_string(arrow_type) or pyarrow.types.is_large_string(arrow_type):
+    return pd.StringDtype("pyarrow")
+  return None
+
+def _read_csv(path) -> pd.DataFrame:
+  """
+  Lee un fichero CSV con el lector multihilo de PyArrow, o con pandas si PyArrow no está instalado.
+  Las columnas de texto se mantienen en Arrow sin pasar por objetos de Python.
+  """
+  if pyarrow is None:
+    return pd.read_csv(path)
+  import pyarrow.csv as pv
+  return pv.read_csv(path).to_pandas(types_mapper=_arrow_string_types)
+
+def _corr_gemm(X: np.ndarray) -> np.ndarray:
+  """
+  Calcula la correlación de Pearson entre las columnas de X con una única multiplicación
+  de matrices sobre los datos centrados, que NumPy delega en BLAS. Las desviaciones típicas
+  se obtienen de la diagonal del resultado, sin volver a recorrer los datos.
+  """
+  centered = X - X.mean(axis=0)
+  comoment = np.dot(centered.T, centered)
+  sd = np.sqrt(np.diag(comoment))
+  with np.errstate(divide='ignore', invalid='ignore'):
+    correlation = comoment / np.outer(sd, sd)
+  return np.clip(correlation, -1, 1)
 
 class ExploratoryDataAnalysis:
   """
   Clase para realizar un análisis exploratorio de datos en un DataFrame de pandas.
+  También admite DataFrames y LazyFrames de Polars, que se evalúan de forma perezosa.
 
   Parámetros:
-  - dataset (pd.DataFrame): El conjunto de datos a analizar.
+  - dataset (pd.DataFrame | pl.DataFrame | pl.LazyFrame | str | Path): El conjunto de datos a analizar
+    o la ruta de un fichero CSV.
+  - precision (str): Precisión ("float64" o "float32") usada en correlaciones e histogramas.
 
   Métodos:
   - setDescription(self, description: str) -> None: Establece la descripción del conjunto de datos.
@@ -19,28 +90,75 @@ class ExploratoryDataAnalysis:
     - getColumns(self) -> list: Devuelve los nombres de las columnas del conjunto de datos.
     - getTypes(self) -> pd.Series: Devuelve los tipos de datos de cada columna.
     - getStatistics(self) -> pd.DataFrame: Devuelve estadísticas descriptivas del conjunto de datos.
+    - get_overview(self) -> pd.DataFrame: Devuelve tipo, valores no nulos, nulos y únicos de cada columna.
     - getNulls(self) -> pd.Series: Devuelve la cantidad de valores nulos por columna.
-    - getBoxplots(self) -> None: Genera boxplots para visualizar la distribución de las variables.
+    - getBoxplots(self, save_path: str) -> None: Genera boxplots para visualizar la distribución de las variables.
     - getUniques(self) -> pd.Series: Devuelve la cantidad de valores únicos por columna.
     - countUniques(self) -> str: Devuelve la cuenta de valores únicos para cada columna.
-    - getHistograms(self, nBins: int) -> None: Genera histogramas para visualizar la distribución de las variables.
-    - getCorrelationMatrix(self) -> None: Genera y muestra la matriz de correlación entre variables.
+    - getHistograms(self, nBins: int, save_path: str) -> None: Genera histogramas para visualizar la distribución de las variables.
+    - plot_numeric_distributions(self, nBins: int, save_path: str) -> None: Genera boxplots e histogramas de las variables numéricas en una sola pasada.
+    - getCorrelationMatrix(self, save_path: str) -> None: Genera y muestra la matriz de correlación entre variables.
+    - stream_describe(chunks) -> pd.DataFrame: Calcula estadísticas descriptivas procesando los datos por bloques.
+    - stream_corr(chunks) -> pd.DataFrame: Calcula la matriz de correlación procesando los datos por bloques.
     - getAutomaticStatisticalEDA(self) -> None: Realiza un análisis estadístico automático utilizando la biblioteca Sweetviz.
     - getAutomaticGraphicalEDA(self) -> None: Realiza un análisis gráfico automático utilizando la biblioteca AutoViz.
     - get_numeric_columns(self) -> pd.Index: Devuelve las columnas numéricas del conjunto de datos.
     - get_categorical_columns(self) -> pd.Index: Devuelve las columnas categóricas del conjunto de datos.
-    - plot_bar_charts_categorical_columns(self) -> None: Genera gráficos de barras para variables categóricas.
+    - plot_bar_charts_categorical_columns(self, save_path: str) -> None: Genera gráficos de barras para variables categóricas.
   """
 
-  def __init__(self, dataset: pd.DataFrame) -> None:
+  _FIG_CACHE_SIZE = 4
+
+  def __init__(self, dataset: "pd.DataFrame | pl.DataFrame | pl.LazyFrame | str | Path", precision: str = "float64") -> None:
     """
     Inicializa la clase con el conjunto de datos.
 
     Parámetros:
-      - dataset (pd.DataFrame): El conjunto de datos a analizar.
+      - dataset (pd.DataFrame | pl.DataFrame | pl.LazyFrame | str | Path): El conjunto de datos a analizar
+        o la ruta de un fichero CSV, que se lee con el lector multihilo de PyArrow si está disponible.
+      - precision (str): Precisión de los cálculos numéricos. "float32" reduce a la mitad la memoria
+        recorrida en correlaciones e histogramas a costa de exactitud. Por defecto, "float64".
     """
+    if precision not in ("float64", "float32"):
+      raise ValueError(f"Precisión no soportada: {precision}. Usa 'float64' o 'float32'.")
+    self.precision = precision
+    self._fig_cache = {}
     self.dataset = dataset
 
+  @property
+  def dataset(self) -> pd.DataFrame:
+    """
+    Devuelve el conjunto de datos analizado.
+    Si se proporcionó un frame de Polars, se materializa en pandas la primera vez que se necesita.
+    """
+    if self._dataset is None and self._lazy is not None:
+      frame = self._lazy.collect()
+      self._dataset = frame.to_pandas() if pyarrow is None else frame.to_pandas(types_mapper=_arrow_string_types)
+    return self._dataset
+
+  @dataset.setter
+  def dataset(self, dataset: "pd.DataFrame | pl.DataFrame | pl.LazyFrame | str | Path") -> None:
+    """
+    Sustituye el conjunto de datos e invalida los resultados cacheados.
+
+    Parámetros:
+      - dataset (pd.DataFrame | pl.DataFrame | pl.LazyFrame): El nuevo conjunto de datos a analizar.
+    """
+    if isinstance(dataset, (str, Path)):
+      dataset = _read_csv(dataset)
+    if pl is not None and isinstance(dataset, (pl.DataFrame, pl.LazyFrame)):
+      self._lazy = dataset.lazy()
+      self._dataset = None
+    else:
+      self._lazy = None
+      self._dataset = _to_arrow_strings(dataset)
+    self._clear_cache()
+
+  def _clear_cache(self) -> None:
+    """Elimina los valores cacheados que dependen del conjunto de datos."""
+    for attr in ('_numeric_columns', '_categorical_columns', '_numeric_values', '_null_counts', '_unique_counts', '_polars_overview'):
+      self.__dict__.pop(attr, None)
+
   def setDescription(self, description: str) -> None:
     """
     Establece la descripción del conjunto de datos.
@@ -56,150 +174,414 @@ class ExploratoryDataAnalysis:
     """
     return self.description
   
+  @cached_property
+  def _polars_overview(self) -> dict:
+    """
+    Calcula en una única consulta de Polars el número de filas, los nulos y los valores
+    únicos de cada columna, de modo que el optimizador recorra los datos una sola vez.
+    """
+    columns = self._lazy.collect_schema().names()
+    overview = self._lazy.select(
+      pl.len().alias('rows'),
+      *[pl.col(col).null_count().alias(f'nulls_{i}') for i, col in enumerate(columns)],
+      *[pl.col(col).drop_nulls().n_unique().alias(f'uniques_{i}') for i, col in enumerate(columns)],
+    ).collect().row(0, named=True)
+    return {
+      'rows': overview['rows'],
+      'nulls': pd.Series([overview[f'nulls_{i}'] for i in range(len(columns))], index=columns),
+      'uniques': pd.Series([overview[f'uniques_{i}'] for i in range(len(columns))], index=columns),
+    }
+
   def getShape(self) -> str:
     """Devuelve la forma (número de filas y columnas) del conjunto de datos."""
+    if self._lazy is not None:
+      return (self._polars_overview['rows'], len(self.getColumns()))
     return (self.dataset.shape)
 
   def getSize(self) -> str:
     """Devuelve el tamaño total del conjunto de datos."""
+    if self._lazy is not None:
+      rows, cols = self.getShape()
+      return (rows * cols)
     return (self.dataset.size)
 
   def getHead(self) -> pd.DataFrame:
     """Devuelve las primeras filas del conjunto de datos."""
+    if self._lazy is not None:
+      return (self._lazy.head().collect().to_pandas())
     return (self.dataset.head())
 
   def getColumns(self) -> list:
     """Devuelve los nombres de las columnas del conjunto de datos."""
+    if self._lazy is not None:
+      return (pd.Index(self._lazy.collect_schema().names()))
     return (self.dataset.columns)
 
   def getTypes(self) -> str:
     """Devuelve los tipos de datos de cada columna."""
+    if self._lazy is not None:
+      return (pd.Series(dict(self._lazy.collect_schema())))
     return (self.dataset.dtypes)
 
+  def _parallel_col_apply(self, func, columns=None) -> list:
+    """
+    Aplica una función a cada columna del conjunto de datos en paralelo.
+
+    Parámetros:
+      - func (callable): Función que recibe una columna (pd.Series).
+      - columns (iterable): Columnas sobre las que aplicar la función. Por defecto, todas.
+
+    Devuelve una lista con los resultados en el mismo orden que las columnas.
+    """
+    if columns is None:
+      columns = self.dataset.columns
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+      return list(executor.map(lambda col: func(self.dataset[col]), columns))
+
   def getStatistics(self) -> pd.DataFrame:
     """Devuelve estadísticas descriptivas del conjunto de datos."""
-    return (self.dataset.describe())
+    if self._lazy is not None:
+      return (self._lazy.describe().to_pandas().set_index('statistic'))
+    numeric_variables = self.dataset.select_dtypes(include='number').columns
+    num_chunks = min(os.cpu_count() or 1, len(numeric_variables))
+    if num_chunks <= 1 or len(self.dataset.select_dtypes(include='datetime').columns) > 0:
+      return (self.dataset.describe())
+    chunk_size = (len(numeric_variables) + num_chunks - 1) // num_chunks
+    chunks = [numeric_variables[i:i + chunk_size] for i in range(0, len(numeric_variables), chunk_size)]
+    with ThreadPoolExecutor(max_workers=num_chunks) as executor:
+      descriptions = list(executor.map(lambda cols: self.dataset[cols].describe(), chunks))
+    return (pd.concat(descriptions, axis=1))
   
+  @cached_property
+  def _null_counts(self) -> pd.Series:
+    if self._lazy is not None:
+      return self._polars_overview['nulls'].rename('nulls')
+    return (len(self.dataset) - self.dataset.count()).rename('nulls')
+
+  @cached_property
+  def _unique_counts(self) -> pd.Series:
+    if self._lazy is not None:
+      return self._polars_overview['uniques'].rename('nunique')
+    return self.dataset.nunique().rename('nunique')
+
+  def get_overview(self) -> pd.DataFrame:
+    """
+    Devuelve, para cada columna, su tipo, el número de valores no nulos, nulos y únicos.
+    Los nulos y los valores únicos se cachean por separado y se reutilizan hasta que cambie el conjunto de datos.
+    """
+    nulls = self._null_counts
+    count = self.getShape()[0] - nulls
+    return pd.DataFrame({'dtype': self.getTypes(), 'count': count, 'nulls': nulls, 'nunique': self._unique_counts})
+
   def getNulls(self) -> str:
     """Devuelve la cantidad de valores nulos por columna."""
-    return (self.dataset.isnull().sum())
+    return (self._null_counts)
+
+  @cached_property
+  def _numeric_columns(self) -> pd.Index:
+    return self.dataset.select_dtypes(include=['float64', 'int64']).columns
 
-  def get_numeric_columns(self):
+  def get_numeric_columns(self) -> pd.Index:
     """Devuelve las columnas numéricas del conjunto de datos."""
-    numeric_cols = self.dataset.select_dtypes(include=['float64', 'int64']).columns
-    return numeric_cols
+    return self._numeric_columns
 
-  def getBoxplots(self) -> None:
+  @cached_property
+  def _numeric_values(self) -> np.ndarray:
+    """
+    Matriz NumPy con las variables numéricas convertidas una sola vez a la precisión configurada.
+    Se guarda por columnas (orden Fortran) para que cada variable ocupe memoria contigua.
+    """
+    return np.asfortranarray(self.dataset[self.get_numeric_columns()].to_numpy(dtype=self.precision))
+
+  def _create_figure(self, name: str, num_rows: int, num_cols: int, figsize: tuple, save_path: str = None) -> tuple:
+    """
+    Crea una figura con una rejilla de subgráficos.
+    Si se indica save_path, la figura se crea directamente sobre el backend Agg,
+    sin pasar por pyplot ni inicializar la interfaz gráfica. Estas figuras se reutilizan
+    entre llamadas del mismo método con la misma rejilla, limpiando sus ejes; la caché
+    conserva como máximo _FIG_CACHE_SIZE figuras.
+
+    Parámetros:
+      - name (str): Nombre del método que dibuja la figura.
+    """
+    if save_path is None:
+      return plt.subplots(num_rows, num_cols, figsize=figsize, squeeze=False)
+    key = (name, num_rows, num_cols, figsize)
+    cached = self._fig_cache.pop(key, None)
+    if cached is not None:
+      fig, axs = cached
+      for extra_ax in set(fig.axes) - set(axs.flat):
+        extra_ax.remove()
+      for ax in axs.flat:
+        ax.clear()
+        ax.axis('on')
+    else:
+      fig = Figure(figsize=figsize)
+      FigureCanvasAgg(fig)
+      axs = fig.subplots(num_rows, num_cols, squeeze=False)
+      if len(self._fig_cache) >= self._FIG_CACHE_SIZE:
+        self._fig_cache.pop(next(iter(self._fig_cache)))
+    self._fig_cache[key] = (fig, axs)
+    return fig, axs
+
+  def _render_figure(self, fig, save_path: str = None) -> None:
+    """
+    Muestra la figura o, si se indica save_path, la guarda en disco.
+    """
+    fig.tight_layout()
+    if save_path is None:
+      plt.show()
+    else:
+      fig.savefig(save_path)
+
+  def getBoxplots(self, save_path: str = None) -> None:
     """
     Genera boxplots para visualizar la distribución de las variables.
+    Parámetros:
+    - save_path (str): Ruta en la que guardar la figura en lugar de mostrarla. Por defecto, se muestra.
     """
     num_cols = 3
-    num_rows = math.ceil(len(self.get_numeric_columns()) / num_cols)
-    fig, axs = plt.subplots(num_rows, num_cols, figsize=(12, 4 * num_rows))
     numeric_variables = self.get_numeric_columns()
-    variable_index = 0
-    for i in range(num_rows):
-      for j in range(num_cols):
-        if variable_index < len(numeric_variables):
-          variable = numeric_variables[variable_index]
-          self.dataset[variable].plot(kind='box', ax=axs[i, j])
-          axs[i, j].set_title(variable)
-          variable_index += 1
-        else:
-          axs[i, j].axis('off')
-    plt.tight_layout()
-    plt.show()
+    num_rows = (len(numeric_variables) + num_cols - 1) // num_cols
+    fig, axs = self._create_figure('getBoxplots', num_rows, num_cols, (12, 4 * num_rows), save_path)
+    axes = axs.flat
+    for j, (variable, ax) in enumerate(zip(numeric_variables, axes)):
+      values = self._numeric_values[:, j]
+      ax.boxplot(values[~np.isnan(values)])
+      ax.set_xticks([1], [variable])
+      ax.set_title(variable)
+    for ax in axes:
+      ax.axis('off')
+    self._render_figure(fig, save_path)
 
   def getUniques(self) -> str:
     """Devuelve la cantidad de valores únicos por columna."""
-    return (self.dataset.nunique())
+    return (self._unique_counts)
 
   def countUniques(self) -> str:
     """
     Devuelve la cuenta para cada valor único en cada columna.
     """
-    result = ""
-    for col in self.getColumns():
-      result += f"\nColumna: {col}\n{self.dataset[col].value_counts()}\n"
-    return result
+    counts = self._parallel_col_apply(lambda col: col.value_counts().astype('int64'))
+    return "".join(f"\nColumna: {col}\n{value_counts}\n" for col, value_counts in zip(self.getColumns(), counts))
 
-  def getHistograms(self, nBins: int = 10) -> None:
+  def getHistograms(self, nBins: int = 10, save_path: str = None) -> None:
     """
     Genera histogramas para visualizar la distribución de las variables numéricas.
     Parámetros:
     - nBins (int): Número de bins (contenedores) para el histograma. Por defecto, se establece en 10.
+    - save_path (str): Ruta en la que guardar la figura en lugar de mostrarla. Por defecto, se muestra.
     """
     num_cols = 3
-    num_rows = math.ceil(len(self.get_numeric_columns()) / num_cols)
-    fig, axs = plt.subplots(num_rows, num_cols, figsize=(12, 4 * num_rows))
     numeric_variables = self.get_numeric_columns()
-    variable_index = 0
-    for i in range(num_rows):
-      for j in range(num_cols):
-        if variable_index < len(numeric_variables):
-          variable = numeric_variables[variable_index]
-          self.dataset[variable].plot(kind='hist', bins=nBins, ax=axs[i, j])
-          axs[i, j].set_title(variable)
-          variable_index += 1
-        else:
-          axs[i, j].axis('off')
-    plt.tight_layout()
-    plt.show()
-
-  def get_categorical_columns(self):
+    num_rows = (len(numeric_variables) + num_cols - 1) // num_cols
+    fig, axs = self._create_figure('getHistograms', num_rows, num_cols, (12, 4 * num_rows), save_path)
+    axes = axs.flat
+    for j, (variable, ax) in enumerate(zip(numeric_variables, axes)):
+      values = self._numeric_values[:, j]
+      counts, edges = np.histogram(values[~np.isnan(values)], bins=nBins)
+      ax.stairs(counts, edges, fill=True)
+      ax.set_ylabel('Frequency')
+      ax.set_title(variable)
+    for ax in axes:
+      ax.axis('off')
+    self._render_figure(fig, save_path)
+
+  def plot_numeric_distributions(self, nBins: int = 10, save_path: str = None) -> None:
+    """
+    Genera, en una sola pasada por cada variable numérica, su boxplot y su histograma lado a lado.
+    Parámetros:
+    - nBins (int): Número de bins (contenedores) para el histograma. Por defecto, se establece en 10.
+    - save_path (str): Ruta en la que guardar la figura en lugar de mostrarla. Por defecto, se muestra.
+    """
+    numeric_variables = self.get_numeric_columns()
+    num_rows = len(numeric_variables)
+    if num_rows == 0:
+      return
+    fig, axs = self._create_figure('plot_numeric_distributions', num_rows, 2, (12, 4 * num_rows), save_path)
+    for j, (variable, (ax_box, ax_hist)) in enumerate(zip(numeric_variables, axs)):
+      values = self._numeric_values[:, j]
+      values = values[~np.isnan(values)]
+      ax_box.boxplot(values)
+      ax_box.set_xticks([1], [variable])
+      ax_box.set_title(variable)
+      counts, edges = np.histogram(values, bins=nBins)
+      ax_hist.stairs(counts, edges, fill=True)
+      ax_hist.set_ylabel('Frequency')
+      ax_hist.set_title(variable)
+    self._render_figure(fig, save_path)
+
+  @cached_property
+  def _categorical_columns(self) -> pd.Index:
+    return self.dataset.select_dtypes(include=['object', 'category', 'string']).columns
+
+  def get_categorical_columns(self) -> pd.Index:
     """Devuelve las columnas categóricas del conjunto de datos."""
-    categorical_cols = self.dataset.select_dtypes(include=['object', 'category']).columns
-    return categorical_cols
+    return self._categorical_columns
 
-  def plot_bar_charts_categorical_columns(self):
+  def plot_bar_charts_categorical_columns(self, save_path: str = None) -> None:
     """
     Genera gráficos de barras para visualizar la distribución de las variables categóricas.
+    Parámetros:
+    - save_path (str): Ruta en la que guardar la figura en lugar de mostrarla. Por defecto, se muestra.
     """
     num_cols = 3
-    num_rows = math.ceil(len(self.get_categorical_columns()) / num_cols)
-    fig, axs = plt.subplots(num_rows, num_cols, figsize=(12, 4 * num_rows))
     categorical_variables = self.get_categorical_columns()
-    variable_index = 0
-    for i in range(num_rows):
-      for j in range(num_cols):
-        if variable_index < len(categorical_variables):
-          variable = categorical_variables[variable_index]
-          self.dataset[variable].value_counts().plot(kind='bar', ax=axs[i, j])
-          axs[i, j].set_title(variable)
-          variable_index += 1
-        else:
-          axs[i, j].axis('off')
-    plt.tight_layout()
-    plt.show()
-
-  def getCorrelationMatrix(self) -> None:
+    num_rows = (len(categorical_variables) + num_cols - 1) // num_cols
+    fig, axs = self._create_figure('plot_bar_charts_categorical_columns', num_rows, num_cols, (12, 4 * num_rows), save_path)
+    axes = axs.flat
+    for variable, ax in zip(categorical_variables, axes):
+      self.dataset[variable].value_counts().plot(kind='bar', ax=ax)
+      ax.set_title(variable)
+    for ax in axes:
+      ax.axis('off')
+    self._render_figure(fig, save_path)
+
+  def _polars_correlation(self) -> pd.DataFrame:
+    """
+    Calcula la correlación de Pearson entre las variables numéricas de un frame de Polars
+    en una única consulta que incluye todos los pares de columnas.
+    """
+    schema = self._lazy.collect_schema()
+    numeric_variables = [col for col, dtype in schema.items() if dtype.is_numeric()]
+    if not numeric_variables:
+      return pd.DataFrame()
+    pairs = [(i, j) for i in range(len(numeric_variables)) for j in range(i, len(numeric_variables))]
+    result = self._lazy.select(
+      [pl.corr(numeric_variables[i], numeric_variables[j]).alias(f'{i}_{j}') for i, j in pairs]
+    ).collect().row(0, named=True)
+    correlation = np.empty((len(numeric_variables), len(numeric_variables)))
+    for i, j in pairs:
+      value = result[f'{i}_{j}']
+      correlation[i, j] = correlation[j, i] = np.nan if value is None else value
+    return pd.DataFrame(correlation, index=numeric_variables, columns=numeric_variables)
+
+  def _pearson_correlation(self) -> pd.DataFrame:
+    """
+    Calcula la correlación de Pearson entre las variables numéricas.
+    Si no hay valores nulos se resuelve con una multiplicación de matrices (BLAS);
+    en caso contrario se recurre a pandas para respetar la eliminación por pares.
+    """
+    if self._lazy is not None:
+      return self._polars_correlation()
+    numeric_variables = self.dataset.select_dtypes(include='number').columns
+    numeric_data = self.dataset[numeric_variables]
+    values = numeric_data.to_numpy(dtype=self.precision, na_value=np.nan)
+    if np.isnan(values).any():
+      return numeric_data.corr()
+    correlation = _corr_gemm(values)
+    return pd.DataFrame(correlation, index=numeric_variables, columns=numeric_variables)
+
+  def getCorrelationMatrix(self, save_path: str = None) -> None:
     """
     Genera y muestra la matriz de correlación entre variables.
-    Utiliza un mapa de calor para visualizar la intensidad de la correlación.
+    Utiliza un mapa de calor para visualizar la intensidad de la correlación. Como la matriz es
+    simétrica, solo se dibuja el triángulo inferior, y las anotaciones se omiten con más de 30 variables.
+    Parámetros:
+    - save_path (str): Ruta en la que guardar la figura en lugar de mostrarla. Por defecto, se muestra.
+    """
+    correlation_matrix = self._pearson_correlation()
+    fig, axs = self._create_figure('getCorrelationMatrix', 1, 1, (10, 8), save_path)
+    ax = axs[0, 0]
+    mask = np.triu(np.ones_like(correlation_matrix, dtype=bool), k=1)
+    annot = len(correlation_matrix.columns) <= 30
+    sns.heatmap(correlation_matrix, mask=mask, annot=annot, cmap="coolwarm", fmt=".2f", linewidths=0.5, ax=ax)
+    ax.set_title("Correlation Matrix")
+    self._render_figure(fig, save_path)
+
+  @staticmethod
+  def stream_describe(chunks) -> pd.DataFrame:
+    """
+    Calcula estadísticas descriptivas de las variables numéricas procesando los datos por bloques,
+    sin necesidad de cargar el conjunto completo en memoria.
+    Las medias y varianzas de cada bloque se combinan con el algoritmo de Chan/Welford.
+
+    Parámetros:
+      - chunks (iterable de pd.DataFrame): Bloques de filas, por ejemplo de pd.read_csv(path, chunksize=...).
+
+    Devuelve un DataFrame con count, mean, std, min y max por columna.
+    """
+    columns = None
+    for chunk in chunks:
+      if columns is None:
+        columns = chunk.select_dtypes(include=['float64', 'int64']).columns
+        count = np.zeros(len(columns))
+        mean = np.zeros(len(columns))
+        m2 = np.zeros(len(columns))
+        minimum = np.full(len(columns), np.nan)
+        maximum = np.full(len(columns), np.nan)
+      numeric_data = chunk[columns]
+      chunk_mean = numeric_data.mean()
+      chunk_count = numeric_data.count().to_numpy(dtype=np.float64)
+      chunk_m2 = ((numeric_data - chunk_mean) ** 2).sum().to_numpy(dtype=np.float64)
+      chunk_mean = np.nan_to_num(chunk_mean.to_numpy(dtype=np.float64))
+      total = count + chunk_count
+      with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.where(total > 0, chunk_count / total, 0.0)
+      delta = chunk_mean - mean
+      mean += delta * ratio
+      m2 += chunk_m2 + delta ** 2 * count * ratio
+      count = total
+      minimum = np.fmin(minimum, numeric_data.min().to_numpy(dtype=np.float64))
+      maximum = np.fmax(maximum, numeric_data.max().to_numpy(dtype=np.float64))
+    if columns is None:
+      return pd.DataFrame()
+    with np.errstate(divide='ignore', invalid='ignore'):
+      std = np.where(count > 1, np.sqrt(m2 / (count - 1)), np.nan)
+    mean = np.where(count > 0, mean, np.nan)
+    return pd.DataFrame([count, mean, std, minimum, maximum], index=['count', 'mean', 'std', 'min', 'max'], columns=columns)
+
+  @staticmethod
+  def stream_corr(chunks) -> pd.DataFrame:
+    """
+    Calcula la matriz de correlación de Pearson de las variables numéricas procesando los datos
+    por bloques. Solo se mantienen en memoria las medias y la matriz de co-momentos, que se
+    combinan entre bloques de forma numéricamente estable. Las filas con nulos se descartan.
+
+    Parámetros:
+      - chunks (iterable de pd.DataFrame): Bloques de filas, por ejemplo de pd.read_csv(path, chunksize=...).
     """
-    correlation_matrix = self.dataset.corr()
-    plt.figure(figsize=(10, 8))
-    sns.heatmap(correlation_matrix, annot=True, cmap="coolwarm", fmt=".2f", linewidths=0.5)
-    plt.title("Correlation Matrix")
-    plt.show()
+    columns = None
+    n = 0
+    for chunk in chunks:
+      if columns is None:
+        columns = chunk.select_dtypes(include=['float64', 'int64']).columns
+      values = chunk[columns].dropna().to_numpy(dtype=np.float64)
+      chunk_n = len(values)
+      if chunk_n == 0:
+        continue
+      chunk_mean = values.mean(axis=0)
+      centered = values - chunk_mean
+      chunk_comoment = np.dot(centered.T, centered)
+      if n == 0:
+        n, mean, comoment = chunk_n, chunk_mean, chunk_comoment
+        continue
+      total = n + chunk_n
+      delta = chunk_mean - mean
+      comoment += chunk_comoment + np.outer(delta, delta) * n * chunk_n / total
+      mean += delta * chunk_n / total
+      n = total
+    if columns is None:
+      return pd.DataFrame()
+    if n == 0:
+      return pd.DataFrame(np.nan, index=columns, columns=columns)
+    std = np.sqrt(np.diag(comoment))
+    with np.errstate(divide='ignore', invalid='ignore'):
+      correlation = np.clip(comoment / np.outer(std, std), -1, 1)
+    return pd.DataFrame(correlation, index=columns, columns=columns)
   
   def getAutomaticStatisticalEDA(self) -> None:
     """
     Realiza un análisis estadístico automático utilizando la biblioteca Sweetviz.
     Se genera un informe estadístico interactivo.
     """
-    try:
-      import sweetviz as sv
-    except ImportError:
-      print("Sweetviz no está instalado. Intentando instalarlo...")
+    global _sv
+    if _sv is None:
       try:
-        import subprocess
-        subprocess.run(["pip", "install", "sweetviz"])
-        from sweetviz import sv
-      except Exception as e:
-        print(f"No se pudo instalar Sweetviz. Por favor, instálalo manualmente. Error: {e}")
-        return
-    advert_report = sv.analyze(self.dataset)
+        import sweetviz as _sv
+      except ImportError as e:
+        raise ImportError("Sweetviz no está instalado. Por favor, instálalo con 'pip install sweetviz'.") from e
+    advert_report = _sv.analyze(self.dataset)
     advert_report.show_notebook(w=1500, h=1000, scale=0.8)
 
   def getAutomaticGraphicalEDA(self) -> None:
@@ -207,18 +589,11 @@ class ExploratoryDataAnalysis:
     Realiza un análisis gráfico automático utilizando la biblioteca AutoViz.
     Se generan visualizaciones gráficas automáticas.
     """
-    try:
-      from autoviz.AutoViz_Class import AutoViz_Class
-    except ImportError:
-      print("Autoviz no está instalado. Intentando instalarlo...")
+    global _AutoViz_Class
+    if _AutoViz_Class is None:
       try:
-        import subprocess
-        subprocess.run(["pip", "install", "autoviz"])
-        from autoviz.AutoViz_Class import AutoViz_Class
-      except Exception as e:
-        print(f"No se pudo instalar Autoviz. Por favor, instálalo manualmente. Error: {e}")
-        return
-    csv_filename = 'temp_dataset.csv'
-    self.dataset.to_csv(csv_filename, index=False)
-    AV = AutoViz_Class()
-    dft = AV.AutoViz(csv_filename)
+        from autoviz.AutoViz_Class import AutoViz_Class as _AutoViz_Class
+      except ImportError as e:
+        raise ImportError("Autoviz no está instalado. Por favor, instálalo con 'pip install autoviz'.") from e
+    AV = _AutoViz_Class()
+    dft = AV.AutoViz("", dfte=self.dataset)